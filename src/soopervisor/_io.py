@@ -1,4 +1,4 @@
-from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -6,6 +6,27 @@ import yaml
 from soopervisor.exceptions import (ConfigurationFileTypeError,
                                     ConfigurationError)
 
+# use the libyaml-backed loader/dumper when PyYAML was built with it, they
+# produce the same output as the pure-Python ones but are much faster
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+@lru_cache(maxsize=128)
+def _parse_config_file(path, mtime_ns, size):
+    """Parse a YAML file, memoized on (resolved path, mtime, size)
+
+    Instantiating several exporters in the same process (e.g., during
+    testing or batch jobs) parses the same config file repeatedly; keying
+    the cache on the file's mtime and size invalidates it whenever the
+    file changes. The path must be resolved so a relative
+    'soopervisor.yaml' loaded from different working directories doesn't
+    alias (mtimes collide naturally: cp -p and tar preserve them).
+    Callers must not mutate the returned object.
+    """
+    # read bytes: libyaml scans them directly, skipping a Python-side decode
+    return yaml.load(Path(path).read_bytes(), Loader=Loader)
+
 
 def load_config_file(path='soopervisor.yaml', expected_env_name=None):
     """
@@ -22,9 +43,12 @@ def load_config_file(path='soopervisor.yaml', expected_env_name=None):
         raise ConfigurationError(f'Error loading {str(path)!r}. Path '
                                  'is a directory.')
 
-    data = yaml.safe_load(Path(path).read_text())
+    st = path.stat()
+    data = _parse_config_file(str(path.resolve()), st.st_mtime_ns, st.st_size)
 
-    if not isinstance(data, Mapping):
+    # the YAML loader always builds plain dicts, so an exact type check
+    # beats the ABC registry lookup
+    if type(data) is not dict:
         raise ConfigurationFileTypeError(path, data)
 
     if expected_env_name and expected_env_name not in data:
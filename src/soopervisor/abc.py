@@ -1,22 +1,60 @@
 """
 Abstract classes that define the protocol for all exporters
 """
-import click
 import abc
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from collections.abc import Mapping
-from typing import Optional, List
-from copy import deepcopy
+from typing import ClassVar, Optional, List
 
 import yaml
 from pydantic import BaseModel
 
-from soopervisor import commons
 from soopervisor.exceptions import (BackendWithoutPresetsError,
                                     InvalidPresetForBackendError,
                                     ConfigurationError)
-from soopervisor._io import load_config_file
-from soopervisor.commons.dag import load_dag_and_spec
+from soopervisor._io import load_config_file, Dumper
+
+
+def _warm_config_cache(path):
+    """Parse a config file to populate the parse cache, ignoring errors
+
+    Runs in a worker thread; errors are left for the load on the main
+    thread, which reports them with the path as the user passed it
+    """
+    try:
+        load_config_file(path)
+    except Exception:
+        pass
+
+
+@lru_cache(maxsize=None)
+def _cached_backend_value(cls):
+    """Per-class cache for cls.get_backend_value()
+    """
+    return cls.get_backend_value()
+
+
+@lru_cache(maxsize=None)
+def _cached_hints(cls):
+    """Per-class cache for the hints dictionary (backend value included)
+    """
+    data = cls._hints()
+    data['backend'] = cls.get_backend_value()
+    return data
+
+
+@lru_cache(maxsize=None)
+def _cached_presets(cls):
+    """Per-class cache for get_presets(), with a frozenset for membership
+    """
+    presets = cls.get_presets()
+
+    if presets is None:
+        return None
+
+    return presets, frozenset(presets)
 
 
 class AbstractConfig(BaseModel, abc.ABC):
@@ -28,8 +66,16 @@ class AbstractConfig(BaseModel, abc.ABC):
         The preset to use, this determines certain settings and is
         backend-specific
     """
+    # string identifier for the backend, set by concrete classes
+    BACKEND: ClassVar[Optional[str]] = None
+
     preset: Optional[str] = None
 
+    # subclasses may set this to True to build instances with construct(),
+    # which skips pydantic's per-field validator chain. Only safe for
+    # classes that don't rely on field validation/coercion
+    _SKIP_VALIDATION = False
+
     class Config:
         extra = 'forbid'
 
@@ -41,8 +87,9 @@ class AbstractConfig(BaseModel, abc.ABC):
         """
         data = load_config_file(path_to_config, expected_env_name=env_name)
 
-        # check data[env_name] is a dictionary
-        if not isinstance(data[env_name], Mapping):
+        # check data[env_name] is a dictionary. the YAML loader always
+        # builds plain dicts, so an exact type check beats the ABC lookup
+        if type(data[env_name]) is not dict:
             raise ConfigurationError(
                 f'Expected key {env_name!r} in {str(path_to_config)!r} '
                 'to contain a dictionary, '
@@ -66,8 +113,6 @@ class AbstractConfig(BaseModel, abc.ABC):
             Path to the config file, only used for displaying it in errors
         """
         # check env_name in data, otherwise the env is corrupted
-        data = deepcopy(data)
-
         if 'backend' not in data:
             raise ConfigurationError(
                 f'Missing {"backend"!r} key for '
@@ -75,7 +120,7 @@ class AbstractConfig(BaseModel, abc.ABC):
                 'Add it and try again.')
 
         actual = data['backend']
-        backend = cls.get_backend_value()
+        backend = _cached_backend_value(cls)
 
         if actual != backend:
             raise ConfigurationError(
@@ -83,23 +128,33 @@ class AbstractConfig(BaseModel, abc.ABC):
                 f'{path_to_config!s}. Expected {backend!r}, '
                 f'actual {actual!r}')
 
-        del data['backend']
+        # shallow-filtered copy: drops the backend key without mutating the
+        # caller's (possibly cached) dictionary
+        kwargs = {k: v for k, v in data.items() if k != 'backend'}
 
-        cfg = cls(**data)
+        if cls._SKIP_VALIDATION:
+            cfg = cls.construct(**kwargs)
+        else:
+            cfg = cls(**kwargs)
 
         # validate presets is valid
-        presets = cls.get_presets()
+        cached = _cached_presets(cls)
 
-        if presets is None and cfg.preset:
+        if cached is None and cfg.preset:
             raise BackendWithoutPresetsError(backend)
 
-        if presets:
-            if cfg.preset is None:
-                cfg.preset = presets[0]
+        # unpack before testing: the cached value is a 2-tuple (always
+        # truthy), and an empty presets list must skip the block
+        if cached is not None:
+            presets, valid = cached
 
-            if cfg.preset not in presets:
-                raise InvalidPresetForBackendError(backend, cfg.preset,
-                                                   presets)
+            if presets:
+                if cfg.preset is None:
+                    cfg.preset = presets[0]
+
+                if cfg.preset not in valid:
+                    raise InvalidPresetForBackendError(
+                        backend, cfg.preset, presets)
 
         return cfg
 
@@ -130,7 +185,9 @@ class AbstractConfig(BaseModel, abc.ABC):
                 'directory, select another name for the target environment'
                 ' and try again.')
 
-        data = {**cls.hints(), **defaults}
+        # hints() already returns a fresh copy, so update it in place
+        data = cls.hints()
+        data.update(defaults)
 
         if preset:
             data['preset'] = preset
@@ -140,24 +197,34 @@ class AbstractConfig(BaseModel, abc.ABC):
         cfg = cls._init(env_name, data, path_to_config)
 
         # pass default_flow_style=None to it serializes lists as [a, b, c]
-        default_data = yaml.safe_dump({env_name: data},
-                                      default_flow_style=None)
+        default_data = yaml.dump({env_name: data},
+                                 Dumper=Dumper,
+                                 default_flow_style=None)
+
+        path = Path(path_to_config)
+
+        # read directly and handle the missing-file case instead of calling
+        # exists() first: a single open replaces a stat plus an open. Bytes
+        # throughout, so the file isn't decoded and re-encoded just to append
+        try:
+            content = path.read_bytes()
 
         # if no config file, write one with env_name section and hints
-        if not Path(path_to_config).exists():
-            Path(path_to_config).write_text(default_data)
+        except FileNotFoundError:
+            path.write_text(default_data)
 
         # if config file but missing env_name section, add one with the hints
         else:
-            path = Path(path_to_config)
-            content = path.read_text()
+            # parse the file: this also rejects existing files that aren't
+            # a mapping (e.g., empty or a list) before we append to them
             env_names = list(load_config_file(path_to_config))
 
             # only update the config file if the section does not exist
             if env_name not in env_names:
                 # append to the text file so we don't delete any existing
                 # comments
-                path.write_text(content + f'\n{default_data}\n')
+                path.write_bytes(content + b'\n' + default_data.encode() +
+                                 b'\n')
             else:
                 raise ConfigurationError(
                     'A target environment named '
@@ -167,11 +234,10 @@ class AbstractConfig(BaseModel, abc.ABC):
         return cfg
 
     @classmethod
-    @abc.abstractmethod
     def get_backend_value(cls):
         """Returns the string identifier for the given backend
         """
-        pass
+        return cls.BACKEND
 
     @classmethod
     def get_presets(cls):
@@ -199,9 +265,8 @@ class AbstractConfig(BaseModel, abc.ABC):
         is created, it also adds the appropriate backend value. Actual
         hint values must be returned in the _hints() method
         """
-        data = cls._hints()
-        data['backend'] = cls.get_backend_value()
-        return data
+        # return a copy so callers don't mutate the cached dictionary
+        return dict(_cached_hints(cls))
 
 
 class AbstractDockerConfig(AbstractConfig):
@@ -263,11 +328,24 @@ class AbstractExporter(abc.ABC):
         """
         Loads an exporter using settings from an existing configuration file
         """
+        # deferred import: pulls in ploomber, which is expensive to import
+        from soopervisor.commons.dag import load_dag_and_spec
+
         # run some basic validations
         cls.validate()
 
-        dag, _ = load_dag_and_spec(env_name, lazy_import=lazy_import)
+        # warm the config parse cache in a worker thread while the (slower)
+        # DAG loads. the path must be resolved before submitting: the DAG
+        # load may chdir temporarily and the working directory is
+        # process-global
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(_warm_config_cache,
+                            Path(path_to_config).resolve())
 
+            dag, _ = load_dag_and_spec(env_name, lazy_import=lazy_import)
+
+        # any chdir has been unwound by now, so the path as passed is safe
+        # again; this load hits the cache warmed above
         cfg = cls.CONFIG_CLASS.load(path_to_config=path_to_config,
                                     env_name=env_name)
 
@@ -277,6 +355,10 @@ class AbstractExporter(abc.ABC):
     def new(cls, path_to_config, env_name, preset=None, lazy_import=False):
         """
         """
+        # deferred import: pulls in ploomber, which is expensive to import
+        from soopervisor import commons
+        from soopervisor.commons.dag import load_dag_and_spec
+
         # run some basic validations
         cls.validate()
 
@@ -305,19 +387,24 @@ class AbstractExporter(abc.ABC):
         Verify project has the right structure before running the script.
         This runs as a sanity check in the development machine
         """
+        from soopervisor import commons
+
         commons.dependencies.check_lock_files_exist()
 
     def add(self):
         """Create a directory with the env_name and add any necessary files
         """
 
-        # check that env_name folder does not exist
+        # check that env_name folder does not exist (single stat call
+        # instead of exists() + is_file())
         path = Path(self._env_name)
 
-        if path.exists():
-            Path(self._env_name)
-
-            kind = 'file' if path.is_file() else 'directory'
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            pass
+        else:
+            kind = 'file' if stat.S_ISREG(st.st_mode) else 'directory'
             raise FileExistsError(
                 f'A {kind} with name {self._env_name!r} '
                 'already exists, delete or rename it and try again')
@@ -338,6 +425,8 @@ class AbstractExporter(abc.ABC):
         Exports to the target environment, calls the private ._export()
         method
         """
+        import click
+
         # TODO: detect inconsistencies. e.g., environment exists but directory
         # doesnt
         if skip_docker:
@@ -1,3 +1,5 @@
+from typing import ClassVar
+
 from soopervisor import abc
 from soopervisor.enum import Backend
 
@@ -7,10 +9,7 @@ from soopervisor.enum import Backend
 # e.g., if using bash, include, exclude and repository
 # are not allowed
 class AirflowConfig(abc.AbstractDockerConfig):
-
-    @classmethod
-    def get_backend_value(cls):
-        return Backend.airflow.value
+    BACKEND: ClassVar[str] = Backend.airflow.value
 
     @classmethod
     def get_presets(cls):
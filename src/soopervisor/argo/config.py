@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 from pydantic import BaseModel
 
@@ -67,8 +67,6 @@ class ArgoConfig(abc.AbstractDockerConfig):
         List of volumes to mount on each Pod, described with the
         ``ArgoMountedVolumes`` schema.
     """
-    mounted_volumes: Optional[List[ArgoMountedVolume]] = None
+    BACKEND: ClassVar[str] = Backend.argo_workflows.value
 
-    @classmethod
-    def get_backend_value(cls):
-        return Backend.argo_workflows.value
+    mounted_volumes: Optional[List[ArgoMountedVolume]] = None
@@ -1,4 +1,4 @@
-from typing import Mapping
+from typing import ClassVar, Mapping
 
 from pydantic import BaseModel
 
@@ -16,6 +16,8 @@ class TaskResource(BaseModel):
 
 
 class AWSBatchConfig(AbstractDockerConfig):
+    BACKEND: ClassVar[str] = Backend.aws_batch.value
+
     # in AWSBatch, repository cannot be None
     repository: str
 
@@ -25,10 +27,6 @@ class AWSBatchConfig(AbstractDockerConfig):
 
     task_resources: Mapping[str, TaskResource] = None
 
-    @classmethod
-    def get_backend_value(cls):
-        return Backend.aws_batch.value
-
     @classmethod
     def _hints(cls):
         return dict(repository='your-repository/name',
@@ -41,12 +39,8 @@ class AWSBatchConfig(AbstractDockerConfig):
 
 
 class CloudConfig(AWSBatchConfig):
-    @classmethod
-    def get_backend_value(cls):
-        return Backend.cloud.value
+    BACKEND: ClassVar[str] = Backend.cloud.value
 
 
 class AWSLambdaConfig(AbstractConfig):
-    @classmethod
-    def get_backend_value(cls):
-        return Backend.aws_lambda.value
+    BACKEND: ClassVar[str] = Backend.aws_lambda.value
@@ -1,6 +1,8 @@
 """
 Loading dags
 """
+import atexit
+import threading
 from pathlib import Path
 
 from ploomber.constants import TaskStatus
@@ -15,6 +17,28 @@ from soopervisor.enum import Mode
 from soopervisor.validate import value_in
 from soopervisor.exceptions import NotATaskError, UpToDateTaskError
 
+_commander = None
+_commander_lock = threading.Lock()
+
+
+def _get_commander():
+    """Process-wide Commander, opened lazily and closed at interpreter exit
+
+    Commander setup/teardown is costly relative to loading a small spec, so
+    it's amortized across all load_dag_and_spec calls in the process (e.g.,
+    when several exporters are instantiated back-to-back)
+    """
+    global _commander
+
+    with _commander_lock:
+        if _commander is None:
+            cmdr = Commander()
+            cmdr.__enter__()
+            atexit.register(cmdr.__exit__, None, None, None)
+            _commander = cmdr
+
+    return _commander
+
 
 def _is_relative_path(path):
     return not Path(path).is_absolute()
@@ -203,10 +227,9 @@ def load_dag_and_spec(env_name, lazy_import=False):
     # initialize dag (needed for validation)
     # TODO: _export also has to find_spec, maybe load it here and
     # pass it directly to _export?
-    with Commander() as cmdr:
-        spec, _ = commons.find_spec(cmdr=cmdr,
-                                    name=env_name,
-                                    lazy_import=lazy_import)
+    spec, _ = commons.find_spec(cmdr=_get_commander(),
+                                name=env_name,
+                                lazy_import=lazy_import)
 
     dag = spec.to_dag().render(force=True, show_progress=False)
 
@@ -1,3 +1,5 @@
+from typing import ClassVar
+
 from soopervisor.enum import Backend
 from soopervisor import abc
 
@@ -5,7 +7,4 @@ from soopervisor import abc
 class SlurmConfig(abc.AbstractConfig):
     """Configuration for exporting to Slurm
     """
-
-    @classmethod
-    def get_backend_value(cls):
-        return Backend.slurm.value
+    BACKEND: ClassVar[str] = Backend.slurm.value
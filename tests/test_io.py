@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pytest
@@ -33,3 +34,32 @@ def test_load_config_file_existing_directory_error(tmp_empty):
 
     expected = ("Error loading 'soopervisor.yaml'. Path is a directory.")
     assert str(excinfo.value) == expected
+
+
+def test_load_config_file_cache_invalidates_on_change(tmp_empty):
+    Path('soopervisor.yaml').write_text('env:\n    backend: first\n')
+
+    assert _io.load_config_file() == {'env': {'backend': 'first'}}
+
+    Path('soopervisor.yaml').write_text('env:\n    backend: second\n')
+
+    assert _io.load_config_file() == {'env': {'backend': 'second'}}
+
+
+def test_load_config_file_cache_distinguishes_directories(tmp_empty):
+    for name, backend in [('a', 'one'), ('b', 'two')]:
+        Path(name).mkdir()
+        Path(name, 'soopervisor.yaml').write_text(
+            f'env:\n    backend: {backend}\n')
+
+    # same relative path, same size, same mtime (as produced by cp -p or
+    # tar), only the directory differs
+    st = Path('a', 'soopervisor.yaml').stat()
+    os.utime(Path('b', 'soopervisor.yaml'),
+             ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    os.chdir('a')
+    assert _io.load_config_file() == {'env': {'backend': 'one'}}
+
+    os.chdir(Path('..', 'b'))
+    assert _io.load_config_file() == {'env': {'backend': 'two'}}